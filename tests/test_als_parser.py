@@ -1,6 +1,9 @@
 """Unit tests for als_parser.py targeting ~60% coverage."""
 
+import contextlib
 import gzip
+import io
+import json
 import math
 import os
 import sys
@@ -9,6 +12,11 @@ import unittest
 from pathlib import Path
 from xml.etree import ElementTree as ET
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'parser'))
 
 from als_parser import (
@@ -17,7 +25,11 @@ from als_parser import (
     _linear_gain_to_db,
     open_als_xml,
     parse_als_from_string,
+    parse_als_with_values,
+    als_inspect,
     extract_tempo,
+    count_notes_per_track,
+    extract_midi_note_array,
     get_device_info,
     get_clip_names,
     extract_track_volume,
@@ -25,9 +37,14 @@ from als_parser import (
     extract_track_muted,
     extract_track_armed,
     extract_track_solo,
+    extract_track_sends,
     extract_track_info,
     extract_master_track_info,
+    extract_plugin_names,
     parse_als_to_json,
+    parse_als,
+    parse_als_batch,
+    summary_to_json,
 )
 
 # ---------------------------------------------------------------------------
@@ -184,6 +201,78 @@ class TestOpenAlsXml(unittest.TestCase):
         finally:
             os.unlink(tmp)
 
+    def test_cached_until_file_changes(self):
+        self.addCleanup(open_als_xml.cache_clear)
+        with tempfile.NamedTemporaryFile(suffix=".als", delete=False, mode="wb") as f:
+            f.write(SIMPLE_PROJECT.encode())
+            tmp = f.name
+        try:
+            first = open_als_xml(Path(tmp))
+            self.assertIs(open_als_xml(tmp), first)
+
+            with open(tmp, "wb") as f:
+                f.write(EMPTY_PROJECT.encode())
+            stat = os.stat(tmp)
+            os.utime(tmp, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+            self.assertIsNot(open_als_xml(Path(tmp)), first)
+        finally:
+            os.unlink(tmp)
+
+
+# ---------------------------------------------------------------------------
+# Debug dump
+# ---------------------------------------------------------------------------
+
+class TestAlsInspect(unittest.TestCase):
+    def test_counts_paths(self):
+        counts = als_inspect(_tree(SIMPLE_PROJECT))
+        self.assertEqual(counts["Ableton"], 1)
+        self.assertEqual(counts["Ableton/LiveSet/Tracks/MidiTrack/MidiClip/Notes/KeyTracks/KeyTrack/Notes/MidiNoteEvent"], 2)
+
+    def test_strips_namespaces(self):
+        counts = als_inspect(_tree('<a xmlns="urn:x"><b/><b><c/></b></a>'))
+        self.assertEqual(counts, {"a": 1, "a/b": 2, "a/b/c": 1})
+
+
+class TestCommentsAndProcessingInstructions(unittest.TestCase):
+    XML = """<Ableton><!-- saved by Live --><?pi x?><LiveSet><Tracks>
+      <MidiTrack Id="1"><Name><UserName Value="Keys" /></Name>
+        <DeviceChain><DeviceChain><Devices><!-- device --><Operator /></Devices></DeviceChain></DeviceChain>
+      </MidiTrack>
+    </Tracks></LiveSet></Ableton>"""
+
+    def test_als_inspect(self):
+        counts = als_inspect(_tree(self.XML))
+        self.assertEqual(counts["Ableton/LiveSet/Tracks/MidiTrack"], 1)
+
+    def test_parse_als_to_json(self):
+        result = parse_als_to_json(_tree(self.XML), "Test")
+        json.dumps(result)
+        devices = result["tracks"]["midi_tracks"][0]["devices"]
+        self.assertEqual([d["name"] for d in devices], ["Operator"])
+
+    def test_parse_als(self):
+        result = summary_to_json(parse_als(io.BytesIO(self.XML.encode())), "Test")
+        json.dumps(result)
+        devices = result["tracks"]["midi_tracks"][0]["devices"]
+        self.assertEqual([d["name"] for d in devices], ["Operator"])
+
+
+class TestParseAlsWithValues(unittest.TestCase):
+    def test_dump_format(self):
+        tree = _tree('<Ableton Creator="Live"><Tempo><Manual Value="120" /></Tempo><Note> hi </Note></Ableton>')
+        buf = io.StringIO()
+        with contextlib.redirect_stdout(buf):
+            parse_als_with_values(tree)
+        self.assertEqual(buf.getvalue().splitlines(), [
+            "Ableton",
+            "  @Creator: Live",
+            "  Ableton/Tempo",
+            "    Ableton/Tempo/Manual",
+            "      @Value: 120",
+            "  Ableton/Note: hi",
+        ])
+
 
 # ---------------------------------------------------------------------------
 # Tempo
@@ -197,6 +286,61 @@ class TestExtractTempo(unittest.TestCase):
         self.assertAlmostEqual(extract_tempo(_tree(EMPTY_PROJECT)), 120.0)
 
 
+# ---------------------------------------------------------------------------
+# Streaming from disk
+# ---------------------------------------------------------------------------
+
+class TestStreamingFromPath(unittest.TestCase):
+    def setUp(self):
+        with tempfile.NamedTemporaryFile(suffix=".als", delete=False) as f:
+            self.path = Path(f.name)
+        with gzip.open(self.path, "wb") as gz:
+            gz.write(SIMPLE_PROJECT.encode())
+
+    def tearDown(self):
+        os.unlink(self.path)
+
+    def test_tempo_from_path(self):
+        self.assertAlmostEqual(extract_tempo(self.path), 140.0)
+
+    def test_tempo_from_path_inside_master(self):
+        xml = """<Ableton><LiveSet>
+          <Tracks><MidiTrack><DeviceChain><Mixer><Volume><Manual Value="1.0"/></Volume></Mixer></DeviceChain></MidiTrack></Tracks>
+          <MainTrack><DeviceChain><Mixer><Tempo><Manual Value="87.5"/></Tempo></Mixer></DeviceChain></MainTrack>
+        </LiveSet></Ableton>"""
+        with gzip.open(self.path, "wb") as gz:
+            gz.write(xml.encode())
+        self.assertAlmostEqual(extract_tempo(self.path), 87.5)
+
+    def test_note_counts_match_tree(self):
+        from_path = count_notes_per_track(self.path)
+        self.assertEqual(from_path, count_notes_per_track(_tree(SIMPLE_PROJECT)))
+        self.assertEqual(from_path[0]["name"], "Drums")
+        self.assertEqual(from_path[0]["note_count"], 2)
+
+    @unittest.skipIf(np is None, "numpy not installed")
+    def test_midi_note_array(self):
+        notes = extract_midi_note_array(self.path)
+        self.assertEqual(len(notes), 2)
+        self.assertEqual(notes["pitch"].tolist(), [36, 36])
+        self.assertEqual(notes["velocity"].tolist(), [100, 80])
+        self.assertEqual(notes["time"].tolist(), [0.0, 2.0])
+        self.assertFalse(notes["muted"].any())
+
+    @unittest.skipIf(np is None, "numpy not installed")
+    def test_midi_note_array_grows(self):
+        events = "".join(
+            f'<MidiNoteEvent Time="{i}" Duration="1" Velocity="90" IsEnabled="{str(i % 2 == 0).lower()}" />'
+            for i in range(3000)
+        )
+        xml = f"<Ableton><KeyTrack><Notes>{events}</Notes><MidiKey Value='60' /></KeyTrack></Ableton>"
+        notes = extract_midi_note_array(io.BytesIO(xml.encode()))
+        self.assertEqual(len(notes), 3000)
+        self.assertEqual(notes["time"][-1], 2999.0)
+        self.assertEqual(int(notes["muted"].sum()), 1500)
+        self.assertTrue((notes["pitch"] == 60).all())
+
+
 # ---------------------------------------------------------------------------
 # Device info
 # ---------------------------------------------------------------------------
@@ -326,6 +470,15 @@ class TestMixerParams(unittest.TestCase):
     def test_solo_false_by_default(self):
         self.assertFalse(extract_track_solo(ET.fromstring("<MidiTrack/>")))
 
+    def test_sends_capped_at_four(self):
+        sends = "".join(
+            f"<TrackSendHolder><Send><Volume><Manual Value='{v}'/></Volume></Send></TrackSendHolder>"
+            for v in (1.0, 0.5, 1.0, 1.0, 0.25)
+        )
+        result = extract_track_sends(_track_elem(f"<Mixer><Sends>{sends}</Sends></Mixer>"))
+        self.assertEqual(sorted(result), ["sendA", "sendB", "sendC", "sendD"])
+        self.assertAlmostEqual(result["sendB"], 20 * math.log10(0.5), places=4)
+
 
 # ---------------------------------------------------------------------------
 # Track info
@@ -358,6 +511,42 @@ class TestExtractTrackInfo(unittest.TestCase):
         self.assertEqual(extract_track_info(_tree(EMPTY_PROJECT)), [])
 
 
+# ---------------------------------------------------------------------------
+# Plugins
+# ---------------------------------------------------------------------------
+
+PLUGIN_PROJECT = """<Ableton><LiveSet><Tracks>
+  <MidiTrack><DeviceChain><DeviceChain><Devices>
+    <PluginDevice><PluginDesc><VstPluginInfo><PlugName Value="Serum"/></VstPluginInfo></PluginDesc></PluginDevice>
+    <PluginDevice><PluginDesc><Vst3PluginInfo><Name Value="Serum"/></Vst3PluginInfo></PluginDesc></PluginDevice>
+  </Devices></DeviceChain></DeviceChain></MidiTrack>
+  <AudioTrack><DeviceChain><DeviceChain><Devices>
+    <PluginDevice><PluginDesc><VstPluginInfo><PlugName Value="Serum"/></VstPluginInfo></PluginDesc></PluginDevice>
+    <Eq8/>
+  </Devices></DeviceChain></DeviceChain></AudioTrack>
+</Tracks></LiveSet></Ableton>"""
+
+
+class TestExtractPluginNames(unittest.TestCase):
+    def test_unique_by_name_and_format(self):
+        plugins = extract_plugin_names(_tree(PLUGIN_PROJECT))
+        self.assertEqual(
+            sorted((p["name"], p["format"]) for p in plugins),
+            [("Serum", "VST"), ("Serum", "VST3")],
+        )
+
+    def test_no_plugins(self):
+        self.assertEqual(extract_plugin_names(_tree(SIMPLE_PROJECT)), [])
+
+    def test_plugin_nested_in_rack(self):
+        xml = """<Ableton><LiveSet><Tracks><AudioTrack><DeviceChain><DeviceChain><Devices>
+          <AudioEffectGroupDevice><Branches><AudioEffectBranch><DeviceChain><AudioToAudioDeviceChain><Devices>
+            <PluginDevice><PluginDesc><AuPluginInfo><Name Value="AUDelay"/></AuPluginInfo></PluginDesc></PluginDevice>
+          </Devices></AudioToAudioDeviceChain></DeviceChain></AudioEffectBranch></Branches></AudioEffectGroupDevice>
+        </Devices></DeviceChain></DeviceChain></AudioTrack></Tracks></LiveSet></Ableton>"""
+        self.assertEqual(extract_plugin_names(_tree(xml)), [{"name": "AUDelay", "format": "Audio Unit"}])
+
+
 # ---------------------------------------------------------------------------
 # Master track
 # ---------------------------------------------------------------------------
@@ -413,5 +602,63 @@ class TestParseAlsToJson(unittest.TestCase):
         self.assertEqual(result["tracks"]["midi_tracks"], [])
 
 
+# ---------------------------------------------------------------------------
+# Integration: single-pass parse_als
+# ---------------------------------------------------------------------------
+
+class TestParseAls(unittest.TestCase):
+    def test_matches_tree_based_json(self):
+        summary = parse_als(io.BytesIO(SIMPLE_PROJECT.encode()))
+        self.assertEqual(
+            summary_to_json(summary, "Test"),
+            parse_als_to_json(_tree(SIMPLE_PROJECT), "Test"),
+        )
+
+    def test_note_counts(self):
+        summary = parse_als(io.BytesIO(SIMPLE_PROJECT.encode()))
+        self.assertEqual(summary.note_counts, count_notes_per_track(_tree(SIMPLE_PROJECT)))
+
+    def test_tempo_inside_master_mixer(self):
+        xml = """<Ableton><LiveSet>
+          <Tracks><AudioTrack Id="1"><DeviceChain><DeviceChain><Devices/></DeviceChain></DeviceChain></AudioTrack></Tracks>
+          <MainTrack>
+            <DeviceChain>
+              <Mixer>
+                <Volume><Manual Value="0.5"/></Volume>
+                <Tempo><Manual Value="98.0"/></Tempo>
+              </Mixer>
+            </DeviceChain>
+          </MainTrack>
+        </LiveSet></Ableton>"""
+        summary = parse_als(io.BytesIO(xml.encode()))
+        self.assertAlmostEqual(summary.tempo, 98.0)
+        self.assertAlmostEqual(summary.master["controls"]["volume"], 20 * math.log10(0.5), places=4)
+
+    def test_tempo_without_value_defaults(self):
+        xml = "<Ableton><LiveSet><Tempo><Manual /></Tempo></LiveSet></Ableton>"
+        self.assertAlmostEqual(parse_als(io.BytesIO(xml.encode())).tempo, 120.0)
+
+    def test_batch_preserves_order(self):
+        paths = []
+        try:
+            for xml in (SIMPLE_PROJECT, EMPTY_PROJECT, SIMPLE_PROJECT):
+                with tempfile.NamedTemporaryFile(suffix=".als", delete=False) as f:
+                    paths.append(Path(f.name))
+                with gzip.open(paths[-1], "wb") as gz:
+                    gz.write(xml.encode())
+            summaries = list(parse_als_batch(paths, max_workers=2))
+        finally:
+            for path in paths:
+                os.unlink(path)
+        self.assertEqual([len(s.tracks) for s in summaries], [3, 0, 3])
+        self.assertAlmostEqual(summaries[0].tempo, 140.0)
+
+    def test_empty_project(self):
+        summary = parse_als(io.BytesIO(EMPTY_PROJECT.encode()))
+        self.assertAlmostEqual(summary.tempo, 120.0)
+        self.assertEqual(summary.tracks, [])
+        self.assertIsNone(summary.master)
+
+
 if __name__ == "__main__":
     unittest.main()